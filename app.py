@@ -7,22 +7,48 @@ and follows a modular structure with separate concerns for routes,
 data management, and storage.
 """
 import os
+from dotenv import load_dotenv
 from flask import Flask
+from jinja2 import FileSystemBytecodeCache
+from helpers.json_provider import ORJSONProvider
 from routes.html_routes import create_html_route
-from routes.error_handlers import page_not_found, internal_server_error
+from routes.error_handlers import ERROR_HANDLERS
 from routes.api_routes import create_api
 from datamanager.sqlite_data_manager import SQLiteDataManager
 from storage import PATH
 
+load_dotenv()
+
 # Create the Flask app
 app = Flask(__name__)
 
-app.secret_key = os.urandom(24)
+# Serialize API responses with orjson
+app.json = ORJSONProvider(app)
+
+# Match routes with or without a trailing slash instead of redirecting
+app.url_map.strict_slashes = False
+
+# A stable key keeps sessions valid across restarts and worker processes
+if not (secret_key := os.environ.get('FLASK_SECRET_KEY')):
+    app.logger.warning(
+        "FLASK_SECRET_KEY is not set; using a random per-process key. "
+        "Sessions will not survive restarts or be shared between workers.")
+    secret_key = os.urandom(24)
+app.secret_key = secret_key
 
 # Set up SQLite database configuration
 app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{PATH}'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# Cache for rarely changing reads such as the home page movies. The default
+# SimpleCache lives in each worker process, so a change made through one worker
+# can take up to CACHE_DEFAULT_TIMEOUT seconds to show on the others; set
+# CACHE_TYPE (e.g. RedisCache with CACHE_REDIS_URL) to share one cache.
+app.config['CACHE_TYPE'] = os.environ.get('CACHE_TYPE', 'SimpleCache')
+app.config['CACHE_DEFAULT_TIMEOUT'] = 60
+if cache_redis_url := os.environ.get('CACHE_REDIS_URL'):
+    app.config['CACHE_REDIS_URL'] = cache_redis_url
+
 # Initialize the SQLiteDataManager
 data_manager = SQLiteDataManager(app)
 
@@ -34,9 +60,32 @@ app.register_blueprint(html_routes, url_prefix='')
 api = create_api(data_manager)
 app.register_blueprint(api, url_prefix='/api')
 
+# Persist compiled templates so new worker processes skip recompiling them. The
+# cache lives in the instance folder (or JINJA_CACHE_DIR) rather than the source
+# tree, and is skipped if the directory cannot be created, e.g. on a read-only image.
+jinja_cache_dir = os.environ.get(
+    'JINJA_CACHE_DIR', os.path.join(app.instance_path, 'jinja_cache'))
+try:
+    os.makedirs(jinja_cache_dir, exist_ok=True)
+except OSError as e:
+    app.logger.warning("Jinja bytecode cache disabled: %s", e)
+else:
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=jinja_cache_dir)
+
+# Compile all templates up front so no request pays for loading them
+for template_name in app.jinja_env.list_templates(extensions=['html']):
+    app.jinja_env.get_template(template_name)
+
 # Register error handlers
-app.register_error_handler(404, page_not_found)
-app.register_error_handler(500, internal_server_error)
+for code_or_exception, handler in ERROR_HANDLERS.items():
+    app.register_error_handler(code_or_exception, handler)
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000)
+    # Development server only; in production run e.g. `gunicorn -w 4 -k gthread app:app`
+    app.run(
+        host="0.0.0.0",
+        port=5000,
+        debug=os.environ.get('FLASK_DEBUG') == '1',
+        use_reloader=False,
+        threaded=True
+    )
@@ -34,6 +34,16 @@ class DataManagerInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_user_with_movies(self, user_id):
+        """
+        Retrieve a specific user together with their movie collection.
+
+        :param user_id: The ID of the user to retrieve.
+        :return: A user record with its movies loaded, or None if not found.
+        """
+        pass
+
     @abstractmethod
     def get_user_movie(self, user_movie_id):
         """
@@ -44,6 +54,17 @@ class DataManagerInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_user_movie_for_user(self, user_id, user_movie_id):
+        """
+        Retrieve a user-specific movie record only if it belongs to the given user.
+
+        :param user_id: The ID of the user who should own the record.
+        :param user_movie_id: The ID of the user-movie record to retrieve.
+        :return: A user-movie record or None if the user or record is not found.
+        """
+        pass
+
     @abstractmethod
     def get_user_movies(self, user_id):
         """
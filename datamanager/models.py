@@ -5,12 +5,17 @@ This module defines the database models for the MovieWeb App, including:
 - UserMovies: Represents the association between users and movies,
   allowing per-user customizations like user-defined title, rating, and notes.
 """
+import re
 from datetime import datetime
-import validators
 from sqlalchemy.orm import validates
 from flask_sqlalchemy import SQLAlchemy
 
-db = SQLAlchemy()
+# Committed objects keep their loaded state, so views that still read them after
+# a commit do not trigger a refresh SELECT
+db = SQLAlchemy(session_options={'expire_on_commit': False})
+
+# An http(s) scheme followed by a host and no whitespace; enough for OMDb and IMDb links
+_URL_RE = re.compile(r'^https?://[^\s/$.?#][^\s]*\Z', re.ASCII)
 
 
 class BaseModel(db.Model):
@@ -23,7 +28,14 @@ class BaseModel(db.Model):
         """
         Converts all column attributes of the model into a dictionary.
         Optionally includes related objects.
+
+        Only relationships that are already loaded are included. The models use
+        lazy='raise_on_sql', so reading an unloaded one would raise instead of
+        querying; eager-load the relationships that should be serialized.
         """
+        if not include_relationships:  # Common case: no recursion bookkeeping needed
+            return self._to_dict_columns_only()
+
         if _seen is None:
             _seen = set()
 
@@ -32,18 +44,43 @@ class BaseModel(db.Model):
         if obj_id in _seen:
             return {'id': self.id}  # Fallback to a basic representation
         _seen.add(obj_id)
-        result = {column.name: getattr(self, column.name) for column in self.__table__.columns}
+        result = self._to_dict_columns_only()
         # Serialize relationships
-        if include_relationships:
-            for relationship in self.__mapper__.relationships:
-                related_value = getattr(self, relationship.key)
-                if isinstance(related_value, list):  # For one-to-many relationships
-                    result[relationship.key] = [
-                        item.to_dict(include_relationships, _seen) for item in related_value]
-                elif related_value:  # For one-to-one or many-to-one relationships
-                    result[relationship.key] = related_value.to_dict(include_relationships, _seen)
+        state = self.__dict__
+        for key, is_collection in self._relationship_descriptors:
+            if key not in state:  # Not loaded; skipped rather than raising
+                continue
+            related_value = state[key]
+            if is_collection:  # For one-to-many relationships
+                result[key] = [
+                    item.to_dict(include_relationships, _seen) for item in related_value]
+            elif related_value:  # For one-to-one or many-to-one relationships
+                result[key] = related_value.to_dict(include_relationships, _seen)
         return result
 
+    @classmethod
+    def __declare_last__(cls):
+        """
+        Stores the column keys and the (key, is_collection) pairs of the relationships
+        of each model once its mapper is configured, so `to_dict` does not walk the
+        table and mapper on every call.
+        """
+        mapper = cls.__mapper__
+        cls._column_keys = tuple(attr.key for attr in mapper.column_attrs)
+        cls._relationship_descriptors = tuple(
+            (rel.key, rel.uselist) for rel in mapper.relationships)
+
+    def _to_dict_columns_only(self):
+        """
+        Converts only the column attributes of the model into a dictionary.
+
+        Loaded values are read straight from the instance dict; only unloaded
+        attributes go through the instrumented descriptor.
+        """
+        state = self.__dict__
+        return {key: state[key] if key in state else getattr(self, key)
+                for key in self._column_keys}
+
 
 class User(BaseModel):
     """
@@ -58,11 +95,15 @@ class User(BaseModel):
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     name = db.Column(db.String(100), nullable=False, unique=True)
 
-    # Relationship to UserMovies with cascading delete behavior
+    # Relationship to UserMovies with cascading delete behavior; the database's
+    # ON DELETE CASCADE removes rows that were never loaded into the session.
+    # Never lazy-loaded with SQL: queries that need the list must eager-load it.
     user_movies = db.relationship(
         'UserMovies',
         back_populates='user',
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy='raise_on_sql'
     )
 
 
@@ -89,11 +130,18 @@ class Movie(BaseModel):
     poster = db.Column(db.String(255))
     imdb_link = db.Column(db.String(255))
 
-    # Relationship to UserMovies with cascading delete behavior
+    # Serves the case-insensitive name lookup in add_movie
+    __table_args__ = (
+        db.Index('ix_movies_name_lower', db.func.lower(name)),
+    )
+
+    # Relationship to UserMovies with cascading delete behavior; never lazy-loaded with SQL
     user_movies = db.relationship(
         'UserMovies',
         back_populates='movie',
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy='raise_on_sql'
     )
 
     @validates('poster', 'imdb_link')
@@ -111,7 +159,7 @@ class Movie(BaseModel):
         Raises:
             ValueError: If the URL is not valid.
         """
-        if value and not validators.url(value):
+        if value and not _URL_RE.match(value):
             raise ValueError(f"{key} must be a valid URL.")
         return value
 
@@ -155,17 +203,23 @@ class UserMovies(BaseModel):
     """
     __tablename__ = 'user_movies'
 
+    # User-specific fields that callers are allowed to change
+    EDITABLE_FIELDS = ('user_title', 'user_rating', 'user_notes')
+
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete="CASCADE"), nullable=False)
-    movie_id = db.Column(db.Integer, db.ForeignKey('movies.id', ondelete="CASCADE"), nullable=False)
+    # Indexed for the "is this movie still used" lookups; user_id lookups are
+    # already served by the unique (user_id, movie_id) constraint's index
+    movie_id = db.Column(
+        db.Integer, db.ForeignKey('movies.id', ondelete="CASCADE"), nullable=False, index=True)
     user_title = db.Column(db.String(100))
     user_rating = db.Column(db.Float)
     user_notes = db.Column(db.Text)
     added_at = db.Column(db.DateTime, default=db.func.now())
 
-    # Relationships
-    user = db.relationship('User', back_populates='user_movies')
-    movie = db.relationship('Movie', back_populates='user_movies')
+    # Relationships; one that needs SQL and was not eager-loaded raises instead
+    user = db.relationship('User', back_populates='user_movies', lazy='raise_on_sql')
+    movie = db.relationship('Movie', back_populates='user_movies', lazy='raise_on_sql')
 
     # Unique constraint to prevent duplicate associations
     __table_args__ = (
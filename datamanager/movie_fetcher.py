@@ -4,9 +4,40 @@ It includes methods to interact with the API and retrieve detailed information
 about movies based on their titles or other criteria.
 """
 import os
+from functools import lru_cache
+import orjson
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, ConnectionError, Timeout, RequestException
+from urllib3.util.retry import Retry
+from helpers.cache import cache
+
+# OMDb results are reused for an hour: repeated titles skip the API, while ratings
+# and other details are still refreshed regularly
+OMDB_CACHE_TIMEOUT = 3600
+
+
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session that keeps connections to the API alive between calls.
+
+    Transient gateway errors are retried with a short backoff.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504),
+                  allowed_methods=frozenset({'GET'}))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Shared by all downloaders so TCP connections are reused across requests
+_SHARED_SESSION = create_session()
 
 
 def load_api_key() -> str:
@@ -46,6 +77,7 @@ class MovieInfoDownloader:
         """
         self._api_url = api_url or "http://www.omdbapi.com/"
         self._api_key = load_api_key()
+        self._session = _SHARED_SESSION
 
     def fetch_movie_data(self, title) -> dict:
         """
@@ -68,12 +100,13 @@ class MovieInfoDownloader:
         }
 
         try:
-            response = requests.get(
-                f"{self._api_url}?t={title}&apikey={self._api_key}",
+            response = self._session.get(
+                self._api_url,
+                params={'t': title, 'apikey': self._api_key},
                 headers=headers,
                 timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if data.get('Response') == 'False':
                 raise APIError(f"OMDb Error: {data.get('Error')}")
@@ -93,3 +126,53 @@ class MovieInfoDownloader:
             raise APIError(f"Error parsing JSON: {json_err}") from json_err
         except RequestException as err:
             raise APIError(f"Error fetching movie info: {err}") from err
+
+
+@lru_cache(maxsize=1)
+def get_movie_downloader() -> MovieInfoDownloader:
+    """
+    Return the shared MovieInfoDownloader, creating it on first use.
+
+    Creation is deferred until a movie is actually fetched, so a missing API key
+    only fails the request that needs it rather than the application import.
+
+    Returns:
+        MovieInfoDownloader: The process-wide downloader instance.
+    """
+    return MovieInfoDownloader()
+
+
+@cache.memoize(timeout=OMDB_CACHE_TIMEOUT)
+def _fetch_movie_data_cached(title) -> dict:
+    """
+    Fetch movie information from OMDb through the shared downloader.
+
+    Successful results are kept for OMDB_CACHE_TIMEOUT seconds; failures raise
+    and are therefore not cached.
+
+    Args:
+        title (str): The normalized title of the movie.
+
+    Returns:
+        dict: The movie details.
+    """
+    return get_movie_downloader().fetch_movie_data(title)
+
+
+def fetch_movie_data(title) -> dict:
+    """
+    Fetch movie information by title, reusing a recent result for the same title.
+
+    Titles are compared case-insensitively and with runs of whitespace collapsed,
+    as OMDb matches them that way too.
+
+    Args:
+        title (str): Title of the movie to search for.
+
+    Returns:
+        dict: A copy of the movie details, so callers may change it freely.
+
+    Raises:
+        APIError: If there is an issue with the request, response, or data processing.
+    """
+    return dict(_fetch_movie_data_cached(' '.join(title.split()).casefold()))
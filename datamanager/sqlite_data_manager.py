@@ -7,16 +7,141 @@ Classes:
     SQLiteDataManager (DataManagerInterface):
                       A class that handles user and movie data in an SQLite database.
 """
+import sqlite3
+from sqlalchemy import and_, bindparam, delete, event, exists, func, select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.schema import CreateIndex
 from datamanager.data_manager import DataManagerInterface
 from datamanager.models import db, User, Movie, UserMovies
-from datamanager.movie_fetcher import MovieInfoDownloader
+from datamanager.movie_fetcher import fetch_movie_data
 from decorators.db_decorators import transactional
+from helpers.cache import cache
+
+# Built once at import; only the columns shown on the home page are selected
+RECENT_MOVIES_STMT = (
+    select(Movie.id, Movie.name, Movie.year, Movie.rating, Movie.poster, Movie.imdb_link)
+    .order_by(Movie.id.desc())
+    .limit(8)
+)
+
+# A user's movies as flat rows: the movie's columns overlaid with the user-specific
+# ones, so `id` is the UserMovies id. Read straight into dicts without the ORM.
+USER_MOVIES_STMT = (
+    select(
+        UserMovies.id,
+        *(column for column in Movie.__table__.c if column.key != 'id'),
+        *(column for column in UserMovies.__table__.c if column.key != 'id'),
+    )
+    .join_from(UserMovies, Movie, UserMovies.movie_id == Movie.id)
+    .where(UserMovies.user_id == bindparam('user_id'))
+)
+
+# Reused for every new user; its compiled form stays in the statement cache. The
+# unique name index detects duplicates, so no separate lookup is needed.
+INSERT_USER_STMT = (
+    insert(User)
+    .on_conflict_do_nothing(index_elements=[User.name])
+    .returning(User.id)
+)
+
+# Stores a fetched movie from its validated column values; if the same title was
+# stored meanwhile, nothing is returned
+INSERT_MOVIE_STMT = (
+    insert(Movie)
+    .on_conflict_do_nothing(index_elements=[Movie.name])
+    .returning(Movie.id)
+)
+
+# Adds a movie to a user's list unless the (user_id, movie_id) pair already exists
+INSERT_USER_MOVIE_STMT = (
+    insert(UserMovies)
+    .on_conflict_do_nothing(index_elements=[UserMovies.user_id, UserMovies.movie_id])
+    .returning(UserMovies.id)
+)
+
+
+def set_sqlite_pragmas(dbapi_connection, _connection_record):
+    """
+    Tunes every new SQLite connection for concurrent reads and cheaper commits.
+
+    WAL mode lets the read-only routes proceed while a write is in progress,
+    and synchronous=NORMAL avoids an fsync on every commit in WAL mode.
+    The 64 MiB page cache lives as long as the pooled connection, so hot
+    pages and indexes stay resident across requests. Memory-mapping the
+    database file lets reads hit the OS page cache directly instead of going
+    through a read() call per page. Foreign keys are enforced so the
+    ON DELETE CASCADE clauses in the schema take effect.
+
+    Args:
+        dbapi_connection: The raw DBAPI connection that was just opened.
+        _connection_record: The pool's record for the connection; required by the
+            event signature but unused.
+    """
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+def create_missing_indexes(engine):
+    """
+    Creates the indexes declared on the models that the database does not have yet.
+
+    The schema is not managed by migrations, so a database created before an
+    index was declared would otherwise never get it. CREATE INDEX IF NOT EXISTS
+    leaves existing indexes alone, so this is safe to run on every start; unlike
+    checkfirst it also recognizes expression indexes such as lower(name).
+
+    Args:
+        engine: The engine of the database to update.
+    """
+    with engine.begin() as connection:
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+
+
+def clear_recent_movies_after_commit(session):
+    """
+    Drops the cached recent movies once a transaction that changed them commits.
+
+    Clearing the cache only after the commit keeps a concurrent home page request
+    from caching the old list again before the change becomes visible.
+
+    Args:
+        session: The session whose transaction has just been committed.
+    """
+    if session.info.pop('recent_movies_changed', False):
+        cache.delete_memoized(SQLiteDataManager.get_recent_movies)
+
+
+def discard_recent_movies_change(session):
+    """
+    Forgets a pending recent movies invalidation when its transaction is rolled back.
+
+    Args:
+        session: The session whose transaction has just been rolled back.
+    """
+    session.info.pop('recent_movies_changed', None)
 
 
 class SQLiteDataManager(DataManagerInterface):
     """
     A class that implements the DataManagerInterface using SQLite as the database.
     This class provides methods for managing users and their movie collections.
+
+    All methods share `db.session`, which Flask-SQLAlchemy scopes to the current
+    app context. Every call made while handling one request therefore reuses the
+    same connection and identity map, so a record loaded by one call is returned
+    from memory by later primary-key lookups in the same request.
     """
 
     def __init__(self, app):
@@ -26,17 +151,29 @@ class SQLiteDataManager(DataManagerInterface):
         Args:
             app: Flask app instance with SQLAlchemy configuration.
         """
+        # Keep connections open between requests instead of reopening the file each
+        # time. Pre-ping and recycling are left off: a local SQLite file has no
+        # server to drop them.
+        app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {'pool_size': 10, 'max_overflow': 20})
         db.init_app(app)  # Initialize SQLAlchemy with Flask app
+        with app.app_context():
+            event.listen(db.engine, "connect", set_sqlite_pragmas)
+            create_missing_indexes(db.engine)
+        event.listen(db.session, "after_commit", clear_recent_movies_after_commit)
+        event.listen(db.session, "after_rollback", discard_recent_movies_change)
+        cache.init_app(app)  # Initialize the cache for rarely changing reads
         self.db = db  # Store the db object for use in methods
 
     def get_all_users(self):
         """
         Retrieves all users from the database.
 
+        Only the id and name columns are selected, so no ORM objects are built.
+
         Returns:
-            list: A list of all users.
+            list: A list of (id, name) rows, one per user.
         """
-        return User.query.all()
+        return self.db.session.execute(select(User.id, User.name)).all()
 
     def get_user_by_id(self, user_id):
         """
@@ -46,9 +183,34 @@ class SQLiteDataManager(DataManagerInterface):
             user_id (int): ID of the user to fetch.
 
         Returns:
-            User or None: User object if found, else None.
+            User or None: User object if found, else None. A user already
+            loaded in the current session is returned without a query.
         """
-        return User.query.get(user_id)
+        return self.db.session.get(User, user_id)
+
+    def get_user_with_movies(self, user_id):
+        """
+        Fetches a user together with their movies in a fixed number of queries.
+
+        The user's UserMovies records and their Movie rows are eager-loaded,
+        so iterating `user.user_movies` does not issue a query per movie.
+        Only the UserMovies columns shown on the page are loaded.
+
+        Args:
+            user_id (int): ID of the user to fetch.
+
+        Returns:
+            User or None: User object with `user_movies` loaded if found, else None.
+        """
+        return self.db.session.execute(
+            select(User)
+            .where(User.id == user_id)
+            .options(
+                selectinload(User.user_movies)
+                .load_only(UserMovies.movie_id, UserMovies.user_title,
+                           UserMovies.user_rating, UserMovies.user_notes)
+                .joinedload(UserMovies.movie))
+        ).scalar_one_or_none()
 
     @transactional(db.session)
     def add_user(self, user_name):
@@ -61,12 +223,9 @@ class SQLiteDataManager(DataManagerInterface):
         Returns:
             dict: A dictionary containing a success or error message.
         """
-        if User.query.filter_by(name=user_name).first():
+        if self.db.session.execute(INSERT_USER_STMT, {"name": user_name}).first() is None:
             return {"error": f"User with the name '{user_name}' already exists."}
 
-        new_user = User(name=user_name)
-        self.db.session.add(new_user)
-
         return {"success": f"User '{user_name}' was successfully added."}
 
     @transactional(db.session)
@@ -81,23 +240,22 @@ class SQLiteDataManager(DataManagerInterface):
             dict: A dictionary with a success or error message.
         """
 
-        if not (user := self.get_user_by_id(user_id)):
-            return {"error": f"User with ID {user_id} not found"}
-
-        # Delete the user (this will trigger cascading deletions for associated user_movies)
-        self.db.session.delete(user)
-
-        # Check and delete movies with no remaining associations
-        movies_with_no_associations = (
-            Movie.query
-            .outerjoin(UserMovies, UserMovies.movie_id == Movie.id)
-            .filter(UserMovies.id == None)
-            .all()
+        # Delete the movies in this user's list that no other user has; only the
+        # user's own movies are checked, not the whole movies table
+        self.db.session.execute(
+            delete(Movie).where(
+                Movie.id.in_(select(UserMovies.movie_id).where(UserMovies.user_id == user_id)),
+                ~exists().where(UserMovies.movie_id == Movie.id, UserMovies.user_id != user_id)
+            ),
+            execution_options={"synchronize_session": False}
         )
 
-        for movie in movies_with_no_associations:
-            self.db.session.delete(movie)
+        # Remove the user's list and the user with one statement each
+        self.db.session.execute(delete(UserMovies).where(UserMovies.user_id == user_id))
+        if not self.db.session.execute(delete(User).where(User.id == user_id)).rowcount:
+            return {"error": f"User with ID {user_id} not found"}
 
+        self._invalidate_recent_movies()
         return {"success": f"User with ID {user_id} "
                            f"and all associated data have been deleted successfully"}
 
@@ -109,57 +267,46 @@ class SQLiteDataManager(DataManagerInterface):
             user_movie_id (int): The ID of the UserMovies record to fetch.
 
         Returns:
-            UserMovies or None: UserMovies object if found, else None.
+            UserMovies or None: UserMovies object with its Movie loaded if found, else None.
         """
-        try:
-            return UserMovies.query.get(user_movie_id)
-        except Exception as e:
-            self.db.session.rollback()
-            print(f"Error fetching movie by ID: {e}")
-            return None
+        return self.db.session.get(
+            UserMovies, user_movie_id, options=[joinedload(UserMovies.movie)])
 
-    def get_user_movies(self, user_id):
+    def get_user_movie_for_user(self, user_id, user_movie_id):
         """
-        Retrieves all movies associated with a specific user,
-        including user-specific overrides.
+        Fetches a UserMovies record owned by the given user in a single query.
+
+        Matching on the record's user_id checks ownership, and the foreign key
+        guarantees that the user exists. The related Movie is loaded in the same
+        statement.
 
         Args:
-            user_id (int): ID of the user whose movies are to be fetched.
+            user_id (int): The ID of the user who should own the record.
+            user_movie_id (int): The ID of the UserMovies record to fetch.
 
         Returns:
-            list: A list of dictionaries containing movie data
-                  with user-specific values where applicable.
+            UserMovies or None: UserMovies object if found for that user, else None.
         """
-        try:
-            user_movies = (
-                db.session.query(UserMovies)
-                .join(Movie)
-                .filter(UserMovies.user_id == user_id)
-                .all()
-            )
-
-            return [
-                {**user_movie.movie.to_dict(), **user_movie.to_dict()}
-                for user_movie in user_movies
-            ]
-        except Exception as e:
-            self.db.session.rollback()
-            print(f"Error fetching user movies: {str(e)}")
-            return []
+        return self.db.session.execute(
+            select(UserMovies)
+            .where(UserMovies.id == user_movie_id, UserMovies.user_id == user_id)
+            .options(joinedload(UserMovies.movie))
+        ).scalar_one_or_none()
 
-    @staticmethod
-    def is_movie_in_user_list(user_id, user_movie_id):
+    def get_user_movies(self, user_id):
         """
-        Checks if a specific movie is in the user's collection.
+        Retrieves all movies associated with a specific user,
+        including user-specific overrides.
 
         Args:
-            user_id (int): The ID of the user.
-            user_movie_id (int): The ID of the UserMovies record.
+            user_id (int): ID of the user whose movies are to be fetched.
 
         Returns:
-            bool: True if the movie is in the user's collection, False otherwise.
+            list: A list of dictionaries containing movie data
+                  with user-specific values where applicable.
         """
-        return UserMovies.query.filter_by(user_id=user_id, id=user_movie_id).first()
+        rows = self.db.session.execute(USER_MOVIES_STMT, {"user_id": user_id}).mappings()
+        return [dict(row) for row in rows]
 
     def get_movie_by_id(self, movie_id):
         """
@@ -171,29 +318,40 @@ class SQLiteDataManager(DataManagerInterface):
         Returns:
             Movie or None: Movie object if found, else None.
         """
-        try:
-            return Movie.query.get(movie_id)
-        except Exception as e:
-            self.db.session.rollback()
-            print(f"Error fetching movie by ID: {str(e)}")
-            return None
+        return self.db.session.get(Movie, movie_id)
 
     @staticmethod
+    @cache.memoize()
     def get_recent_movies():
         """
         Retrieves the most recent movies from the database.
 
+        The result is cached for CACHE_DEFAULT_TIMEOUT seconds and dropped
+        whenever movies are added or removed. Movies are returned as plain
+        dictionaries, so no ORM instances are built or cached.
+
         Returns:
-            list: A list of the most recent 8 movies.
+            list: A list of dictionaries for the most recent 8 movies.
         """
-        return Movie.query.order_by(Movie.id.desc()).limit(8).all()
+        return [dict(row) for row in db.session.execute(RECENT_MOVIES_STMT).mappings()]
+
+    def _invalidate_recent_movies(self):
+        """
+        Marks the cached recent movies as stale after the set of movies has changed.
+
+        The cache is cleared by `clear_recent_movies_after_commit` once the
+        current transaction commits, and left alone if it is rolled back.
+        """
+        self.db.session.info['recent_movies_changed'] = True
 
-    @transactional(db.session)
     def add_movie(self, user_id, movie_name):
         """
         Adds a movie to a specific user's collection.
         If the movie doesn't exist, fetches it from OMDb.
 
+        The lookup before the fetch only reads, so SQLite holds no transaction
+        while OMDb responds; the inserts run as one transaction in `_save_movie`.
+
         Args:
             user_id (int): The ID of the user adding the movie.
             movie_name (str): The name of the movie to be added.
@@ -205,26 +363,58 @@ class SQLiteDataManager(DataManagerInterface):
         if not self.get_user_by_id(user_id):
             return {"error": f"User with ID {user_id} not found."}
 
-        # Check if the movie already exists (case-insensitive)
-        movie = Movie.query.filter(Movie.name.ilike(movie_name)).first()
+        # Look up the movie (case-insensitive, served by the lower(name) index) and
+        # this user's association with it in one query
+        movie = self.db.session.execute(
+            select(Movie.id, Movie.name, UserMovies.id.label('user_movie_id'))
+            .outerjoin(UserMovies, and_(UserMovies.movie_id == Movie.id,
+                                        UserMovies.user_id == user_id))
+            .where(func.lower(Movie.name) == func.lower(movie_name))
+            .limit(1)
+        ).first()
 
         # Check if the movie is already in the user's collection
-        if movie and UserMovies.query.filter_by(user_id=user_id, movie_id=movie.id).first():
+        if movie and movie.user_movie_id is not None:
             return {"error": f"You already have the movie '{movie_name}' in your list!"}
 
-        # Add new movie if not already in database
-        if not movie:
-            movie_data = MovieInfoDownloader().fetch_movie_data(movie_name)
+        movie_data = None if movie else fetch_movie_data(movie_name)
+        return self._save_movie(user_id, movie_name, movie, movie_data)
+
+    @transactional(db.session)
+    def _save_movie(self, user_id, movie_name, movie, movie_data):
+        """
+        Stores a newly fetched movie if needed and adds it to the user's collection.
+
+        Args:
+            user_id (int): The ID of the user adding the movie.
+            movie_name (str): The name of the movie as entered by the user.
+            movie (Row or None): The stored movie found by `add_movie`, if any.
+            movie_data (dict or None): OMDb data for a movie that is not stored yet.
+
+        Returns:
+            dict: A dictionary containing a success or error message.
+        """
+        if movie:
+            movie_id, title = movie.id, movie.name
+        else:
+            # Building the model runs its year and URL validators before anything is stored
             movie = Movie(**movie_data)
-            self.db.session.add(movie)
-            self.db.session.commit()
-
-        # Associate movie with the user
-        self.db.session.add(UserMovies(
-            user_id=user_id,
-            movie_id=movie.id,
-            user_title=movie.name
-            ))
+            title = movie.name
+            movie_id = self.db.session.execute(
+                INSERT_MOVIE_STMT, {key: getattr(movie, key) for key in movie_data}
+            ).scalar()
+            if movie_id is None:
+                # OMDb resolved the title to a movie that is already stored
+                movie_id = self.db.session.scalar(select(Movie.id).where(Movie.name == title))
+            else:
+                self._invalidate_recent_movies()
+
+        # Associate movie with the user; a concurrent add of the same movie is
+        # caught by the unique constraint instead of failing the transaction
+        if self.db.session.execute(INSERT_USER_MOVIE_STMT, {
+            "user_id": user_id, "movie_id": movie_id, "user_title": title
+        }).first() is None:
+            return {"error": f"You already have the movie '{movie_name}' in your list!"}
         return {"success": f"Movie '{movie_name}' was successfully "
                            f"added to your list!"}
 
@@ -240,16 +430,25 @@ class SQLiteDataManager(DataManagerInterface):
         Returns:
             dict: A dictionary with success or error message.
         """
-        if not (user_movie := self.get_user_movie(user_movie_id)):
-            return {"error": "This movie is not in your list."}
-
-        for key, value in updated_details.items():
-            if hasattr(user_movie, key):
-                setattr(user_movie, key, value)
-            else:
+        for key in updated_details:
+            if key not in UserMovies.EDITABLE_FIELDS:
                 return {"error": f"Invalid attribute '{key}' for movie details."}
+        if not updated_details:
+            return {"error": "No movie details were provided."}
+
+        # A single UPDATE; no UserMovies instance is loaded or flushed
+        movie_id = self.db.session.execute(
+            update(UserMovies)
+            .where(UserMovies.id == user_movie_id)
+            .values(updated_details)
+            .returning(UserMovies.movie_id),
+            execution_options={"synchronize_session": False}
+        ).scalar_one_or_none()
+        if movie_id is None:
+            return {"error": "This movie is not in your list."}
 
-        return {"success": f"Movie '{user_movie.movie.name}' has been successfully updated."}
+        movie = self.db.session.get(Movie, movie_id)
+        return {"success": f"Movie '{movie.name}' has been successfully updated."}
 
     @transactional(db.session)
     def delete_movie(self, user_movie_id):
@@ -265,13 +464,20 @@ class SQLiteDataManager(DataManagerInterface):
         if not (user_movie := self.get_user_movie(user_movie_id)):
             return {"error": "This movie is not in your list."}
 
-        movie = user_movie.movie
+        movie_id, movie_name = user_movie.movie_id, user_movie.movie.name
 
-        self.db.session.delete(user_movie)
+        self.db.session.execute(delete(UserMovies).where(UserMovies.id == user_movie_id))
 
-        if not UserMovies.query.filter_by(movie_id=movie.id).first():
-            self.db.session.delete(movie)
+        # Remove the movie in the same transaction if no other user still has it
+        self.db.session.execute(
+            delete(Movie).where(
+                Movie.id == movie_id,
+                ~exists().where(UserMovies.movie_id == movie_id)
+            ),
+            execution_options={"synchronize_session": False}
+        )
 
+        self._invalidate_recent_movies()
         return {
-            "success": f"Movie '{movie.name}' has been successfully removed from your list."
+            "success": f"Movie '{movie_name}' has been successfully removed from your list."
         }
@@ -26,7 +26,7 @@ def handle_api_errors():
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                logger.error(f"Error in {func.__name__}: {str(e)}")
+                logger.error("Error in %s: %s", func.__name__, e)
                 return create_error_response(message="An unexpected error occurred."), 500
         return wrapper
     return decorator
@@ -59,10 +59,10 @@ def validate_json(required_keys=None):
                 return func(*args, **kwargs)
             except BadRequest as e:
                 logger.error(
-                    f"BadRequest in {func.__name__}: Invalid JSON format: {str(e)}")
+                    "BadRequest in %s: Invalid JSON format: %s", func.__name__, e)
                 return create_error_response(message="Invalid JSON format"), 400
             except Exception as e:
-                logger.error(f"Unexpected error in {func.__name__}: {str(e)}")
+                logger.error("Unexpected error in %s: %s", func.__name__, e)
                 return create_error_response(
                     message="An error occurred during JSON validation."), 500
         return wrapper
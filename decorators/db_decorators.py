@@ -44,15 +44,15 @@ def transactional(session):
                 return result
             except SQLAlchemyError as e:
                 session.rollback()
-                logger.error(f"Database error in {func.__name__}: {str(e)}")
+                logger.error("Database error in %s: %s", func.__name__, e)
                 raise e
             except APIError as e:
                 session.rollback()
-                logger.error(f"API error in {func.__name__}: {str(e)}")
+                logger.error("API error in %s: %s", func.__name__, e)
                 raise e
             except Exception as e:
                 session.rollback()
-                logger.error(f"Unexpected error in {func.__name__}: {str(e)}")
+                logger.error("Unexpected error in %s: %s", func.__name__, e)
                 raise e
 
         return wrapper
@@ -75,7 +75,7 @@ def validate_user(session):
     def decorator(func):
         @wraps(func)
         def wrapper(user_id, *args, **kwargs):
-            if not session.query(User).get(user_id):
+            if not session.get(User, user_id):
                 return {"error": f"User with ID {user_id} does not exist."}
             return func(user_id, *args, **kwargs)
 
@@ -99,7 +99,7 @@ def validate_movie(session):
     def decorator(func):
         @wraps(func)
         def wrapper(movie_id, *args, **kwargs):
-            if not session.query(Movie).get(movie_id):
+            if not session.get(Movie, movie_id):
                 return {"error": f"Movie with ID {movie_id} does not exist."}
             return func(movie_id, *args, **kwargs)
 
@@ -123,7 +123,8 @@ def validate_user_movie(session):
     def decorator(func):
         @wraps(func)
         def wrapper(user_id, movie_id, *args, **kwargs):
-            if not session.query(UserMovies).filter_by(user_id=user_id, movie_id=movie_id).first():
+            if session.query(UserMovies.id).filter_by(
+                    user_id=user_id, movie_id=movie_id).scalar() is None:
                 return {"error": f"Movie with ID {movie_id} is not in the user's list."}
             return func(user_id, movie_id, *args, **kwargs)
 
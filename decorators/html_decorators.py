@@ -2,53 +2,14 @@
 This module provides reusable decorators for HTML routes in Flask applications.
 
 Decorators included:
-- `handle_errors`: Handles exceptions and renders error pages for HTML routes.
 - `validate_form`: Ensures required form fields are present in POST requests.
 - `validate_user`: Verifies the existence of a user by their user ID.
 """
 from functools import wraps
-from flask import render_template, redirect, request
-from sqlalchemy.exc import SQLAlchemyError
-from helpers.logger import logger
+from flask import redirect, request
 from helpers.html_helpers import flash_message, render_error_page
 
 
-def handle_errors():
-    """
-    A decorator to handle exceptions for HTML routes and render appropriate error pages.
-
-    Usage:
-        @handle_errors()
-        def your_route():
-            ...
-
-    Returns:
-        Function: The wrapped function with error handling.
-    """
-
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                return func(*args, **kwargs)
-            except SQLAlchemyError as db_error:
-                logger.error(f"Database error in {func.__name__}: {str(db_error)}")
-                # Render an error page for database-specific errors
-                return render_template(
-                    "error.html", error_message="A database error occurred. Please try again later."
-                ), 500
-            except Exception as e:
-                logger.error(f"Unhandled error in {func.__name__}: {str(e)}")
-                # Render a generic error page for unhandled exceptions
-                return render_template(
-                    "error.html", error_message="An unexpected error occurred."
-                ), 500
-
-        return wrapper
-
-    return decorator
-
-
 def validate_form(required_fields=None):
     """
     A decorator to validate if required form fields are present in POST requests.
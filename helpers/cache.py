@@ -0,0 +1,14 @@
+"""
+This module provides the application-wide cache instance.
+
+The cache is created unbound and attached to the Flask app with `init_app`,
+following the same pattern as the SQLAlchemy `db` object. Its backend and
+default timeout come from the app's CACHE_* configuration.
+
+Exports:
+    cache: A Flask-Caching instance shared by all application modules.
+"""
+
+from flask_caching import Cache
+
+cache = Cache()
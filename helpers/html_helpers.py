@@ -1,10 +1,13 @@
 """
 This module defines helper functions for common operations in the Flask app.
-These functions help with flashing messages and rendering error pages.
+These functions help with flashing messages, rendering error pages,
+streaming large pages and answering conditional requests.
 """
 
-
-from flask import render_template, flash
+import hashlib
+from flask import (
+    current_app, flash, get_flashed_messages, make_response, request, session,
+    stream_template)
 
 
 def flash_message(message, category="info"):
@@ -12,7 +15,49 @@ def flash_message(message, category="info"):
     flash(message, category)
 
 
+def render_plain_template(template_name, **context):
+    """Render a cached template directly, skipping Flask's context processors."""
+    return current_app.jinja_env.get_template(template_name).render(**context)
+
+
 def render_error_page(status_code, message):
     """Render a standardized error page."""
-    return render_template(
+    return render_plain_template(
         "error.html", error_message=message, status_code=status_code), status_code
+
+
+def stream_page(template_name, **context):
+    """Stream a template to the client while it is being rendered."""
+    # Pop flashed messages now: the session cookie is sent before the body
+    get_flashed_messages()
+    return current_app.response_class(stream_template(template_name, **context))
+
+
+def conditional_page(version_keys, build_response):
+    """
+    Answer with 304 Not Modified when the client already has this page version.
+
+    Args:
+        version_keys (iterable): The rendered values of the page, e.g. one tuple of
+            fields per row. Ids alone are not enough, as SQLite reuses the highest
+            id after it is deleted.
+        build_response (callable): Renders the page when it has to be sent.
+
+    Returns:
+        Response: The page, or an empty 304 response, tagged with an ETag.
+    """
+    # A page carrying a flashed message is a one-off and must not be reused
+    if '_flashes' in session:
+        return build_response()
+
+    etag = hashlib.sha1(repr(tuple(version_keys)).encode()).hexdigest()
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = make_response(build_response())
+    response.set_etag(etag)
+    # Pages depend on the session and on the current data, so shared caches must
+    # not store them; the browser revalidates its copy with the ETag
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
@@ -1,11 +1,17 @@
 """
 This module provides a centralized logging configuration for the application.
 
-The logger is configured to use a rotating file handler, ensuring that log files
-do not grow indefinitely. It includes a timestamp in log messages for better
-tracking and debugging. The logger is reusable across all application modules.
+Log records are handed to a queue and written to a rotating log file by a
+background listener thread, so logging an error never blocks a request on
+file I/O. Records are still formatted in the logging thread; only the write
+moves to the listener. The listener is started by the first record each
+process logs, so worker processes forked from a preloading master (e.g.
+`gunicorn --preload`) get their own. It includes a timestamp in log messages
+for better tracking and debugging. The logger is reusable across all
+application modules.
 
 Features:
+    - Queue-based handler so request threads never wait on disk writes.
     - Rotating file handler to limit log file size and maintain backups.
     - Timestamped log messages for better tracking.
     - Single reusable logger instance for consistency.
@@ -14,13 +20,65 @@ Exports:
     logger: A pre-configured logger instance ready for use in other modules.
 """
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import SimpleQueue
+
+
+class ProcessLocalQueueHandler(QueueHandler):
+    """
+    A queue handler that starts its listener thread in each process that logs.
+
+    Threads do not survive a fork, so a listener started at import time would
+    not be running in forked workers and their records would never be written.
+    """
+
+    def __init__(self, queue, *handlers):
+        """
+        Initialize the handler with its queue and the handlers the listener feeds.
+
+        Args:
+            queue: The queue records are put on.
+            *handlers: The handlers that write the queued records.
+        """
+        super().__init__(queue)
+        self._handlers = handlers
+        self._listener_pid = None
+        self._start_lock = threading.Lock()
+
+    def emit(self, record):
+        """
+        Queue a record, first starting the listener if this process has none.
+
+        Args:
+            record (logging.LogRecord): The record to log.
+        """
+        if self._listener_pid != os.getpid():
+            self._start_listener()
+        super().emit(record)
+
+    def _start_listener(self):
+        """
+        Start a listener for the current process and stop it again at exit.
+        """
+        with self._start_lock:
+            if self._listener_pid == os.getpid():
+                return
+            if self._listener_pid is not None:
+                # Forked from a process whose listener owns the records queued so far
+                self.queue = SimpleQueue()
+            listener = QueueListener(self.queue, *self._handlers, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)  # Flush pending records on shutdown
+            self._listener_pid = os.getpid()
 
 
 def configure_logger():
     """
-    Configures and returns a logger with a rotating file handler and timestamped format.
+    Configures and returns a logger that writes through a queue to a rotating file.
 
     Returns:
         logging.Logger: Configured logger instance.
@@ -28,19 +86,23 @@ def configure_logger():
     logger = logging.getLogger("app_logger")  # Custom logger name to avoid conflicts
     logger.setLevel(logging.ERROR)  # Set the global log level
 
-    # Create a rotating file handler
-    handler = RotatingFileHandler('app.log', maxBytes=10000, backupCount=1)
-    handler.setLevel(logging.ERROR)
+    if logger.handlers:  # Avoid duplicate handlers and listeners
+        return logger
+
+    # Create a rotating file handler, written to only by the listener thread;
+    # the file is not opened until the first record is written
+    file_handler = RotatingFileHandler(
+        'app.log', maxBytes=10_000_000, backupCount=3, delay=True)
+    file_handler.setLevel(logging.ERROR)
 
     # Set a formatter with a timestamp
     formatter = logging.Formatter(
         '%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S'
     )
-    handler.setFormatter(formatter)
+    file_handler.setFormatter(formatter)
 
-    # Add the handler to the logger
-    if not logger.handlers:  # Avoid duplicate handlers
-        logger.addHandler(handler)
+    # Request threads only enqueue records; the listener does the writing
+    logger.addHandler(ProcessLocalQueueHandler(SimpleQueue(), file_handler))
 
     return logger
 
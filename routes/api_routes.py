@@ -36,7 +36,7 @@ def create_api(data_manager):
         """
         users = data_manager.get_all_users()
         return create_success_response(
-            data=[user.to_dict(include_relationships=False) for user in users]), 200
+            data=[user._asdict() for user in users]), 200
 
     @api.route('/users/<int:user_id>', methods=['GET'])
     @handle_api_errors()
@@ -1,15 +1,24 @@
 """
 This module defines custom error handlers for the Flask application.
 
-The error handlers provide custom error pages for specific HTTP errors like 404 and 500.
+The error handlers provide custom error pages for specific HTTP errors like 404 and 500,
+and a single catch-all for exceptions raised by the HTML routes.
 
 Error Handlers:
     - 404: Page Not Found error.
     - 500: Internal Server Error.
+    - SQLAlchemyError: Database errors raised while handling a request.
+    - Exception: Any other unhandled exception.
+
+ERROR_HANDLERS maps each error code to its handler and is the single place
+the application registers them from.
 """
 
-from flask import render_template
 from flask import current_app
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import HTTPException
+from helpers.html_helpers import render_plain_template
+from helpers.logger import logger
 
 
 def page_not_found(e):
@@ -23,8 +32,8 @@ def page_not_found(e):
     Returns:
         Response: The rendered HTML template for the 404 error page.
     """
-    current_app.logger.error(f"Page not found: {e}")
-    return render_template('404.html', error_message="Page not found."), 404
+    current_app.logger.error("Page not found: %s", e)
+    return render_plain_template('404.html', error_message="Page not found."), 404
 
 
 def internal_server_error(e):
@@ -38,5 +47,48 @@ def internal_server_error(e):
     Returns:
         Response: The rendered HTML template for the 500 error page.
     """
-    current_app.logger.error(f"Server Error: {e}")
-    return render_template('500.html', error_message="Something went wrong on our end."), 500
+    current_app.logger.error("Server Error: %s", e)
+    return render_plain_template(
+        '500.html', error_message="Something went wrong on our end."), 500
+
+
+def database_error(e):
+    """
+    Handles database errors that escape a route.
+    Logs the error and renders the generic error page.
+
+    Args:
+        e: The SQLAlchemy exception, passed automatically by Flask.
+
+    Returns:
+        Response: The rendered error page with a 500 status code.
+    """
+    logger.error("Database error: %s", e)
+    return render_plain_template(
+        "error.html", error_message="A database error occurred. Please try again later."), 500
+
+
+def unhandled_exception(e):
+    """
+    Handles any other exception that escapes a route.
+    Logs the error with its traceback and renders the generic error page.
+
+    Args:
+        e: The exception, passed automatically by Flask.
+
+    Returns:
+        Response: The rendered error page with a 500 status code, or the
+                  HTTP exception itself so Flask answers it as usual.
+    """
+    if isinstance(e, HTTPException):
+        return e
+    logger.exception("Unhandled error: %s", e)
+    return render_plain_template("error.html", error_message="An unexpected error occurred."), 500
+
+
+ERROR_HANDLERS = {
+    404: page_not_found,
+    500: internal_server_error,
+    SQLAlchemyError: database_error,
+    Exception: unhandled_exception,
+}
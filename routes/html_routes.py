@@ -16,16 +16,17 @@ Routes:
 - /users/<int:user_id>/delete_movie/<int:user_movie_id>: Deletes a movie from a user's collection.
 """
 from flask import Blueprint, render_template, redirect, url_for, request
-from helpers.html_helpers import flash_message, render_error_page
+from helpers.html_helpers import (
+    conditional_page, flash_message, render_error_page, stream_page)
 from helpers.logger import logger
-from decorators.html_decorators import handle_errors, validate_form, validate_user
+from decorators.html_decorators import validate_form, validate_user
+from datamanager.models import UserMovies
 
 
 def create_html_route(data_manager):
     html_routes = Blueprint('html_routes', __name__)
 
     @html_routes.route('/')
-    @handle_errors()
     def home():
         """
         Render the home page with a list of featured movies.
@@ -40,10 +41,11 @@ def create_html_route(data_manager):
         """
 
         recent_movies = data_manager.get_recent_movies()
-        return render_template('home.html', featured_movies=recent_movies)
+        return conditional_page(
+            [tuple(movie.values()) for movie in recent_movies],
+            lambda: render_template('home.html', featured_movies=recent_movies))
 
     @html_routes.route('/users')
-    @handle_errors()
     def list_users():
         """
         Render the users list page with all registered users.
@@ -57,10 +59,11 @@ def create_html_route(data_manager):
             all user data, or an error page if a server issue occurs.
         """
         users = data_manager.get_all_users()
-        return render_template('users.html', users=users)
+        return conditional_page(
+            [tuple(user) for user in users],
+            lambda: stream_page('users.html', users=users))
 
     @html_routes.route('/add_user', methods=['GET', 'POST'])
-    @handle_errors()
     @validate_form(required_fields=['name'])
     def add_user():
         """
@@ -89,8 +92,6 @@ def create_html_route(data_manager):
         return redirect(url_for('html_routes.list_users'))
 
     @html_routes.route('/users/<int:user_id>')
-    @handle_errors()
-    @validate_user(data_manager)
     def user_movies(user_id):
         """
         Displays the movie collection for a specific user.
@@ -109,12 +110,11 @@ def create_html_route(data_manager):
             On failure: An error page with an appropriate status code (404 if the user is not found,
                         500 for internal errors).
         """
-        user = data_manager.get_user_by_id(user_id)
-        movies = data_manager.get_user_movies(user_id)
-        return render_template('user_movies.html', user=user, movies=movies)
+        if not (user := data_manager.get_user_with_movies(user_id)):
+            return render_error_page(404, f"User with ID {user_id} not found.")
+        return stream_page('user_movies.html', user=user, movies=user.user_movies)
 
     @html_routes.route('/delete_user/<int:user_id>', methods=['POST'])
-    @handle_errors()
     def delete_user(user_id):
         """
         Deletes a user from the database.
@@ -131,14 +131,13 @@ def create_html_route(data_manager):
         """
 
         if "error" in (result := data_manager.delete_user(user_id)):
-            logger.error(f"Error in delete_user: {result['error']}")
+            logger.error("Error in delete_user: %s", result['error'])
             return render_error_page(404, result["error"])
 
         flash_message(result["success"], "success")
         return redirect(url_for('html_routes.list_users'))
 
     @html_routes.route('/users/<int:user_id>/add_movie', methods=['GET', 'POST'])
-    @handle_errors()
     @validate_user(data_manager)
     @validate_form(required_fields=['movie_name'])
     def add_movie(user_id):
@@ -167,8 +166,6 @@ def create_html_route(data_manager):
         return redirect(url_for('html_routes.user_movies', user_id=user_id))
 
     @html_routes.route('/users/<int:user_id>/update_movie/<int:user_movie_id>', methods=['GET', 'POST'])
-    @handle_errors()
-    @validate_user(data_manager)
     @validate_form()
     def update_movie(user_id, user_movie_id):
         """
@@ -186,18 +183,14 @@ def create_html_route(data_manager):
             On error: Render the error page or redirect with an error message.
         """
 
-        if not (user_movie := data_manager.is_movie_in_user_list(
-                user_id=user_id, user_movie_id=user_movie_id)):
-            flash_message("This movie is not in your list.", "error")
-            return redirect(url_for('html_routes.user_movies', user_id=user_id))
+        if not (user_movie := data_manager.get_user_movie_for_user(user_id, user_movie_id)):
+            return render_error_page(404, "This movie is not in your list.")
 
         if request.method == 'GET':
             return render_template('update_movie.html', user_movie=user_movie)
 
-        updated_details = request.form.to_dict()
-
-        user_rating = updated_details.get('user_rating')
-        updated_details['user_rating'] = user_rating if user_rating else None
+        updated_details = {
+            field: request.form.get(field) or None for field in UserMovies.EDITABLE_FIELDS}
 
         if "success" in (result := data_manager.update_movie(user_movie_id, updated_details)):
             flash_message(result["success"], "success")
@@ -206,7 +199,6 @@ def create_html_route(data_manager):
         return redirect(url_for('html_routes.user_movies', user_id=user_id))
 
     @html_routes.route('/users/<int:user_id>/delete_movie/<int:user_movie_id>', methods=['POST'])
-    @handle_errors()
     def delete_movie(user_id, user_movie_id):
         """
         Deletes a specific movie from a user's collection.